@@ -43,6 +43,49 @@ def lookup_reread_false(sample_file_: Path):
     return FileLookup(sample_file_, reread_on_query=False)
 
 
+@pytest.fixture
+def lookup_shell(sample_file_: Path):
+    """FileLookup that always runs grep/awk (no in-process fallback)."""
+    return FileLookup(sample_file_, reread_on_query=True, shell_threshold=0)
+
+
+# ------- Regression Tests ---------
+def test_linear_search_keeps_mmap_position(tmp_path: Path):
+    """A padded-line scan must not break later scans of the shared mmap."""
+    path = tmp_path / "padded.txt"
+    path.write_bytes(b"a\nneedle\nb\n key1 \nc\n")
+    lookup = FileLookup(path, reread_on_query=True)
+    assert lookup.mmap_search(b"needle\n") is True
+    assert lookup.linear_search(b"key1\n") is True
+    assert lookup.mmap_search(b"needle\n") is True
+    assert lookup.linear_search(b"zzz\n") is False
+    assert lookup.mmap_search(b"needle\n") is True
+    assert lookup.find_match(b"needle\n") is True
+    assert lookup.grep_search(b"needle\n") is True
+    assert lookup.search_awk(b"needle\n") is True
+
+
+def test_linear_search_empty_query(tmp_path: Path):
+    """An empty query only matches a blank line, as line.strip() did."""
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"a\nb\n")
+    assert FileLookup(path).linear_search(b"\n") is False
+    assert FileLookup(path).linear_search(b"\x01\x02") is False
+    path.write_bytes(b"a\n\nb\n")
+    assert FileLookup(path).linear_search(b"\n") is True
+
+
+def test_unicode_whitespace_is_stripped(tmp_path: Path):
+    """Lines are trimmed like str.strip(), not only of ASCII whitespace."""
+    path = tmp_path / "unicode.txt"
+    path.write_bytes("a\nneedle\u00a0\n\u3000key1\n".encode("utf-8"))
+    lookup = FileLookup(path)
+    assert lookup.cache_lookup(b"needle\n") is True
+    assert lookup.linear_search(b"needle\n") is True
+    assert lookup.cache_lookup(b"key1\n") is True
+    assert lookup.linear_search(b"key1\n") is True
+
+
 # ------- Benchmarks Tests ---------
 @pytest.mark.benchmark(group="search_methods", min_rounds=10)
 def test_linear_search(benchmark: BenchmarkFixture,
@@ -64,23 +107,45 @@ def test_mmap_search(benchmark: BenchmarkFixture,
 
 @pytest.mark.benchmark(group="search_methods", min_rounds=10)
 def test_grep_search(benchmark: BenchmarkFixture,
-                     lookup_reread_true: FileLookup):
-    assert benchmark(lookup_reread_true.grep_search, b"needle\n") is True
+                     lookup_shell: FileLookup):
+    assert benchmark(lookup_shell.grep_search, b"needle\n") is True
 
 
 @pytest.mark.benchmark(group="search_methods", min_rounds=10)
 def test_grep_search_m1(benchmark: BenchmarkFixture,
-                        lookup_reread_true: FileLookup):
-    assert benchmark(lookup_reread_true.grep_search_m_1, b"needle\n") is True
+                        lookup_shell: FileLookup):
+    assert benchmark(lookup_shell.grep_search_m_1, b"needle\n") is True
+
+
+@pytest.mark.benchmark(group="search_methods_not_found", min_rounds=10)
+def test_grep_search_m1_not_found(benchmark: BenchmarkFixture,
+                                  lookup_shell: FileLookup):
+    assert benchmark(lookup_shell.grep_search_m_1,
+                     b"value_does_not_exist\n") is False
 
 
 @pytest.mark.benchmark(group="search_methods", min_rounds=10)
 def test_search_awk(benchmark: BenchmarkFixture,
-                    lookup_reread_true: FileLookup):
-    assert benchmark(lookup_reread_true.search_awk, b"needle\n") is True
+                    lookup_shell: FileLookup):
+    assert benchmark(lookup_shell.search_awk, b"needle\n") is True
 
 
 @pytest.mark.benchmark(group="search_methods", min_rounds=10)
 def test_cache_lookup(benchmark: BenchmarkFixture,
                       lookup_reread_false: FileLookup):
     assert benchmark(lookup_reread_false.cache_lookup, b"needle\n") is True
+
+
+@pytest.mark.benchmark(group="cache_batch", min_rounds=10)
+def test_cache_lookup_many(benchmark: BenchmarkFixture,
+                           lookup_reread_false: FileLookup):
+    queries = [b"needle\n", b"key1\n", b"value_does_not_exist\n"] * 100
+    expected = [True, True, False] * 100
+    assert benchmark(lookup_reread_false.cache_lookup_many, queries) == expected
+
+
+@pytest.mark.benchmark(group="cache_not_found", min_rounds=10)
+def test_cache_lookup_not_found(benchmark: BenchmarkFixture,
+                                lookup_reread_false: FileLookup):
+    assert benchmark(lookup_reread_false.cache_lookup,
+                     b"value_does_not_exist\n") is False
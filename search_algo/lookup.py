@@ -5,27 +5,64 @@ This module provides the `FileLookup` strategy for matching query strings
 against entries stored in a text file. It supports two modes of operation:
 
 - Cached lookups: Load all entries into memory once and query from cache.
-- Memory-mapped lookups: Re-read the file on each query using `mmap`.
+- Memory-mapped lookups: Search the file on each query through an `mmap`
+  that is created once and reused until `FileLookup.close` is called.
 
 It also includes utility functions such as `sanitize_payload` for safely
 decoding and cleaning raw byte input before performing lookups.
 """
 
 from __future__ import annotations
+import functools
 import logging
+import os
 from pathlib import Path
+import re
 import subprocess
-from typing import Optional
+from typing import BinaryIO, Callable, Iterable, Optional
 import mmap
 
+# Files smaller than this are searched in-process instead of spawning a shell
+# tool, whose fork/exec cost dwarfs the scan itself at these sizes.
+SHELL_THRESHOLD = 64 * 1024 * 1024
 
-def sanitize_payload(raw: bytes, strip_ctrl: bool = True) -> str:
+# Mappings up to this size are prefetched whole with MADV_WILLNEED; larger ones
+# only get sequential readahead so they do not flood the page cache.
+WILLNEED_THRESHOLD = 256 * 1024 * 1024
+
+# Files larger than this are memory-mapped and split in chunks when building
+# the cache so the whole file and its split lines are never held in memory at
+# the same time.
+READ_CHUNK_THRESHOLD = 100 * 1024 * 1024
+_READ_CHUNK_SIZE = 16 * 1024 * 1024
+
+# str.translate table deleting ASCII control characters (C0 and DEL), i.e.
+# exactly the ASCII characters that str.isprintable() rejects
+_CTRL_TABLE = dict.fromkeys([*range(0x20), 0x7F])
+# Maximum number of per-query matchers kept by a FileLookup
+_NEEDLE_CACHE_SIZE = 1024
+
+# Whitespace that bytes.strip() removes besides the line endings
+_LINE_WHITESPACE = (b" ", b"\t", b"\x0b", b"\x0c")
+# ASCII bytes that str.strip() removes but bytes.strip() does not
+_STR_ONLY_WHITESPACE = (b"\x1c", b"\x1d", b"\x1e", b"\x1f")
+# Anything str.strip() could remove from a line
+_PADDING_RE = re.compile(rb"[ \t\x0b\x0c\x1c-\x1f\x80-\xff]")
+
+# Any ASCII control byte; payloads without one take the fast path
+_HAS_CTRL_RE = re.compile(rb"[\x00-\x1f\x7f]")
+
+
+def _sanitize_payload_uncached(raw: bytes, strip_ctrl: bool = True) -> str:
     """
     Decode a raw byte payload into a clean string.
 
     The function attempts to decode the input bytes as UTF-8 while ignoring
     any undecodable sequences. It then strips trailing null characters and
-    newlines, and optionally removes all non-printable (control) characters.
+    newlines, and optionally removes all non-printable characters: with a
+    single ``str.translate`` call for ASCII text, and with ``isprintable``
+    per character otherwise. Payloads that are printable ASCII once stripped
+    skip all of that and are decoded as ASCII directly.
 
     Args:
         raw (bytes): The raw byte sequence to sanitize.
@@ -35,46 +72,266 @@ def sanitize_payload(raw: bytes, strip_ctrl: bool = True) -> str:
     Returns:
         str: A sanitized string with nulls/newlines removed and optionally
         stripped of non-printable characters.
+
+    Notes:
+        ``sanitize_payload`` is this function wrapped in an LRU cache keyed
+        on ``(raw, strip_ctrl)``, so ``raw`` must be hashable (``bytes``).
+        Callers that rarely repeat a payload can call
+        ``_sanitize_payload_uncached`` to skip the cache bookkeeping.
     """
+    # Fast path: printable ASCII needs no decoding or control-char removal
+    stripped = raw.rstrip(b"\x00\r\n").strip()
+    if stripped.isascii() and not _HAS_CTRL_RE.search(stripped):
+        return stripped.decode("ascii")
     text = raw.decode("utf-8", errors="ignore").rstrip("\x00\r\n")
     if strip_ctrl:  # Remove control characters from the string
-        text = "".join(ch for ch in text if ch.isprintable())
+        if text.isascii():
+            text = text.translate(_CTRL_TABLE)
+        else:
+            text = "".join(ch for ch in text if ch.isprintable())
     return text.strip()
 
 
+sanitize_payload = functools.lru_cache(maxsize=1024)(
+    _sanitize_payload_uncached
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _sanitize_bytes(raw: bytes) -> bytes:
+    """Memoized `sanitize_payload` (control chars stripped), UTF-8 encoded."""
+    return _sanitize_payload_uncached(raw, strip_ctrl=True).encode()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_lineset(path: str, mtime_ns: int) -> frozenset[bytes]:
+    """
+    Read a file once and return its lines as a frozenset.
+
+    Cached per ``(path, mtime_ns)``, so repeated calls for an unchanged
+    file reuse the set and a modified file is read again.
+    """
+    with open(path, "rb") as f:
+        return frozenset(f.read().splitlines())
+
+
+def _line_matcher(line: bytes) -> Callable[[mmap.mmap], bool]:
+    """
+    Build a check for whether ``line`` appears as a complete line in a buffer.
+
+    The needles for the first, middle and last line are built once here and
+    bound into the returned function, so a query that is searched repeatedly
+    only pays for the scan. The scan runs directly on the buffer with
+    ``find`` and only compares the leading and trailing bytes for the
+    first/last line, so a mapped file is never copied into a bytes object.
+    Lines may end in ``\n`` or ``\r\n``.
+
+    Args:
+        line (bytes): The line to look for, without its newline.
+
+    Returns:
+        Callable[[mmap.mmap], bool]: Returns True if ``line`` is one of the
+        lines of the buffer it is given.
+    """
+    size = len(line)
+    first, first_crlf = line + b"\n", line + b"\r\n"
+    middle, middle_crlf = b"\n" + line + b"\n", b"\n" + line + b"\r\n"
+
+    def match(buf: mmap.mmap) -> bool:
+        # First line of the file
+        head = buf[:size + 2]
+        if head[:size + 1] == first or head == first_crlf:
+            return True
+        # Any line in the middle of the file. The explicit start matters:
+        # mmap.find() otherwise searches from the mapping's file position.
+        if buf.find(middle, 0) != -1 or buf.find(middle_crlf, 0) != -1:
+            return True
+        # Last line of the file when it has no trailing newline. An empty
+        # line can only be a blank line, which the checks above cover.
+        if size == 0:
+            return False
+        end = len(buf)
+        if buf[end - 1:end] == b"\r":
+            end -= 1
+        if end < size or buf[end - size:end] != line:
+            return False
+        return end == size or buf[end - size - 1:end - size] == b"\n"
+
+    return match
+
+
+def _strip_line(line: bytes) -> bytes:
+    """Strip ``line`` like ``str.strip()`` would strip its UTF-8 text."""
+    text = line.decode("utf-8", errors="surrogateescape").strip()
+    return text.encode("utf-8", errors="surrogateescape")
+
+
+def _split_lines(data: bytes) -> Iterable[bytes]:
+    """
+    Split ``data`` into lines stripped of surrounding whitespace.
+
+    ``splitlines()`` already drops ``\\n``/``\\r\\n`` endings in C. Stripping
+    spaces and tabs as well is only needed if the buffer contains any, which
+    a few ``memchr`` scans tell us; even then it runs as ``map(bytes.strip)``
+    without a Python-level loop. Buffers with non-ASCII bytes or
+    ``\\x1c``-``\\x1f`` go through `_strip_line` instead, so Unicode
+    whitespace such as U+00A0 is trimmed exactly as ``str.strip()`` does.
+
+    Args:
+        data (bytes): The raw file contents.
+
+    Returns:
+        Iterable[bytes]: The normalized lines.
+    """
+    lines = data.splitlines()
+    if not data.isascii() or any(ws in data for ws in _STR_ONLY_WHITESPACE):
+        return map(_strip_line, lines)
+    if any(ws in data for ws in _LINE_WHITESPACE):
+        return map(bytes.strip, lines)
+    return lines
+
+
+def _read_lines_mmap(f: BinaryIO) -> set[bytes]:
+    """
+    Collect the lines of a binary file into a set by scanning a memory map.
+
+    The mapping is walked in chunks cut at a newline found with ``rfind``
+    (or ``find`` for a line longer than a chunk), and each chunk is split
+    with `_split_lines`. Pages are read straight from the page cache with
+    sequential readahead, and no more than one chunk is copied at a time.
+
+    Args:
+        f (BinaryIO): A non-empty file object opened in binary mode.
+
+    Returns:
+        set[bytes]: The lines of the file, stripped of whitespace.
+    """
+    lines: set[bytes] = set()
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        size = len(mm)
+        pos = 0
+        while pos < size:
+            end = min(pos + _READ_CHUNK_SIZE, size)
+            if end < size:
+                cut = mm.rfind(b"\n", pos, end)
+                if cut == -1:  # line longer than a chunk
+                    cut = mm.find(b"\n", end)
+                end = size if cut == -1 else cut + 1
+            lines.update(_split_lines(mm[pos:end]))
+            pos = end
+    return lines
+
+
+def _shell_env() -> dict[str, str]:
+    """Environment for shell tools: the C locale makes them compare bytes."""
+    return {"LC_ALL": "C", "PATH": os.environ.get("PATH", os.defpath)}
+
+
 class FileLookup:
     """Lookup strategy that matches strings against lines in a text file."""
-    def __init__(self, filepath: Path, reread_on_query: bool = False) -> None:
+    def __init__(self, filepath: Path, reread_on_query: bool = False,
+                 shell_threshold: int = SHELL_THRESHOLD,
+                 debug: bool = False) -> None:
         self.filepath = Path(filepath)
         self.reread_on_query = reread_on_query
-        self._cache: dict[str, bool] = self._read_file()
+        self.debug = debug
+        self._mm: Optional[mmap.mmap] = None
+        self._mm_fd: Optional[int] = None
+        self._mm_stamp: Optional[tuple[int, int, int]] = None
+        self._mm_padded: Optional[bool] = None
+        self._needle_cache: dict[bytes, Callable[[mmap.mmap], bool]] = {}
+        self._cache: set[bytes] = self._read_file()
+        # Whether grep/awk are worth spawning, decided once for the file
+        self._use_shell = os.stat(self.filepath).st_size >= shell_threshold
+
+    def _get_mmap(self) -> mmap.mmap:
+        """
+        Return a read-only memory map of the lookup file.
+
+        The file is opened and mapped lazily on first use and the mapping is
+        reused by later queries, so repeated searches skip the
+        open/mmap/munmap syscalls and hit pages that are already faulted in.
+        Each call stats the file and maps it again if its size, modification
+        time or inode changed, so appended or replaced files are always seen
+        (like `_load_lineset`). Right after mapping, files up to
+        ``WILLNEED_THRESHOLD`` bytes are prefetched with ``MADV_WILLNEED`` so
+        the first scan overlaps with disk reads; larger files get
+        ``MADV_SEQUENTIAL`` readahead instead.
 
-    def _read_file(self) -> dict[str, bool]:
+        Returns:
+            mmap.mmap: The cached memory map of the lookup file.
+        """
+        if self._mm is not None:
+            st = os.stat(self.filepath)
+            if (st.st_size, st.st_mtime_ns, st.st_ino) != self._mm_stamp:
+                self.close()  # The file changed since it was mapped
+        if self._mm is None:
+            fd = os.open(self.filepath, os.O_RDONLY)
+            try:
+                st = os.fstat(fd)
+                mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except Exception:
+                os.close(fd)
+                raise
+            if len(mm) <= WILLNEED_THRESHOLD:
+                if hasattr(mmap, "MADV_WILLNEED"):
+                    mm.madvise(mmap.MADV_WILLNEED, 0, len(mm))
+            elif hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            self._mm, self._mm_fd = mm, fd
+            self._mm_stamp = (st.st_size, st.st_mtime_ns, st.st_ino)
+        return self._mm
+
+    def _matcher_for(self, line: bytes) -> Callable[[mmap.mmap], bool]:
+        """Return the cached `_line_matcher` for ``line``, building it once."""
+        matcher = self._needle_cache.get(line)
+        if matcher is None:
+            if len(self._needle_cache) >= _NEEDLE_CACHE_SIZE:
+                self._needle_cache.clear()
+            matcher = self._needle_cache[line] = _line_matcher(line)
+        return matcher
+
+    def close(self) -> None:
+        """Unmap the cached memory map and close its file descriptor."""
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+            self._mm_padded = None
+        if self._mm_fd is not None:
+            os.close(self._mm_fd)
+            self._mm_fd = None
+
+    def __del__(self) -> None:
+        self.close()
+
+    def _read_file(self) -> set[bytes]:
         """
         Read the lookup file into memory and build a cache.
 
-        Each line of the file is stripped of whitespace and stored as a key in
-        a dictionary with the value set to True, \
-            enabling O(1) membership checks.
+        The file is read with a single ``read()`` and split with
+        `_split_lines`, which also strips surrounding whitespace, so the lines
+        are stored as raw bytes in a set without a Python-level loop,
+        enabling O(1) membership checks without decoding. Files of
+        ``READ_CHUNK_THRESHOLD`` bytes or more are memory-mapped and split
+        chunk by chunk instead, which skips the copy into a user buffer and
+        avoids doubling peak memory.
 
         Returns:
-            dict[str, bool]: A dictionary of lookup entries where keys are
-            normalized lines from the file and values are always True.
+            set[bytes]: The normalized lines from the file.
 
         Notes:
-            - If the file does not exist, an empty dictionary is returned and
-            an error is logged.
-            - If any other error occurs during reading, it is logged and an
-            empty dictionary is returned.
+            - If the file does not exist, an error is logged and
+            ``FileExistsError`` is raised.
+            - If any other error occurs during reading, it is logged and
+            re-raised as ``Exception``.
         """
         try:
-            lookup_table: dict[str, bool] = {}
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    key = line.strip()
-                    # Build the cache with all string in the line as True
-                    lookup_table[key] = True
-            return lookup_table
+            with open(self.filepath, "rb") as f:
+                if os.fstat(f.fileno()).st_size >= READ_CHUNK_THRESHOLD:
+                    return _read_lines_mmap(f)
+                return set(_split_lines(f.read()))
         except FileNotFoundError:
             logging.error("Lookup file not found: %s", self.filepath)
             raise FileExistsError
@@ -93,6 +350,12 @@ class FileLookup:
             - ``-q``: Suppress output (rely on exit code).
             - ``-m 1``: Stop searching after the first match.
 
+        Files smaller than ``shell_threshold`` bytes are searched in-process
+        with `mmap_search` instead, since spawning ``grep`` costs far more
+        than the scan. ``grep`` is started with ``os.posix_spawnp``, which
+        skips the fork and Python-side setup of ``subprocess.Popen``, and
+        runs with ``LC_ALL=C`` to compare raw bytes.
+
         Args:
             self (FileLookup): \
                 The lookup object holding the file path.
@@ -104,16 +367,22 @@ class FileLookup:
                 - ``False`` if the query string was not found.
                 - ``None`` if an error occurred while executing grep.
         """
+        if not self._use_shell:
+            return self.mmap_search(query)
         query_str = sanitize_payload(query, strip_ctrl=True)
         command = ["grep", "-F", "-x", "-q", "-m", "1",
                    query_str, str(self.filepath)]
+        # Discard grep's stdout/stderr in the child
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0)
+            for fd in (1, 2)
+        ]
         try:
-            process = subprocess.Popen(
-                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
-            )
-            process.wait()
+            pid = os.posix_spawnp(command[0], command, _shell_env(),
+                                  file_actions=file_actions)
+            _, status = os.waitpid(pid, 0)
             result = (True, False)
-            return result[process.returncode]
+            return result[os.waitstatus_to_exitcode(status)]
         except Exception as e:
             logging.error(f"Error: {e}")
             return False
@@ -130,6 +399,10 @@ class FileLookup:
             - ``-q``: Suppress all output; \
                 only the return code indicates match status.
 
+        Files smaller than ``shell_threshold`` bytes are searched in-process
+        with `mmap_search` instead, since spawning ``grep`` costs far more
+        than the scan. ``grep`` runs with ``LC_ALL=C`` to compare raw bytes.
+
         Args:
             self (FileLookup): The lookup object holding the file path.
             query (bytes): The raw query string as bytes.
@@ -140,12 +413,15 @@ class FileLookup:
                 - ``False`` if the query string was not found.
                 - ``None`` if an error occurred while executing grep.
         """
+        if not self._use_shell:
+            return self.mmap_search(query)
         query_str = sanitize_payload(query, strip_ctrl=True)
         command = ["grep", "-F", "-x", "-q",
                    query_str, str(self.filepath)]
         try:
             process = subprocess.Popen(
-                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                env=_shell_env()
             )
             process.wait()
             result = (True, False)
@@ -156,10 +432,19 @@ class FileLookup:
 
     def linear_search(self, query: bytes) -> bool:
         """
-        Perform a manual linear search over the file contents.
-
-        This method reads the file line by line, stripping whitespace,
-        and checks for an exact match against the query string.
+        Perform a linear search over the file contents.
+
+        Like the original line-by-line loop, a line matches if it equals the
+        query once surrounding whitespace (including ``\r`` and Unicode
+        whitespace) is stripped.
+        The file is first scanned for the query as a complete ``\n`` or
+        ``\r\n`` terminated line with ``find`` over the cached memory map
+        (see `_get_mmap`). Only on a miss, and only if the file contains
+        anything ``str.strip()`` could remove at all (spaces, tabs, VT, FF,
+        ``\x1c``-``\x1f`` or non-ASCII bytes), are its lines stripped with
+        `_strip_line` and compared one by one. With
+        ``debug=True`` the original line-by-line Python loop is used instead
+        for comparison.
 
         Args:
             self (FileLookup): The lookup object holding the file path.
@@ -171,13 +456,31 @@ class FileLookup:
                 - ``False`` if not found, or if an error occurred \
                     (e.g., file I/O error).
         """
-        query_str = sanitize_payload(query, strip_ctrl=True)
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    if query_str == line.strip():
-                        return True
-            return False
+            if self.debug:
+                query_str = sanitize_payload(query, strip_ctrl=True)
+                with open(self.filepath, "r", encoding="utf-8") as f:
+                    for line in f:
+                        if query_str == line.strip():
+                            return True
+                return False
+            line = _sanitize_bytes(query)
+            mm = self._get_mmap()
+            if self._matcher_for(line)(mm):
+                return True
+            # Padded lines only match once stripped: check (once per
+            # mapping) whether the file has any padding before scanning
+            if self._mm_padded is None:
+                self._mm_padded = _PADDING_RE.search(mm) is not None
+            if not self._mm_padded:
+                return False
+            # readline() moves the shared mapping's position; put it back
+            pos = mm.tell()
+            try:
+                mm.seek(0)
+                return line in map(_strip_line, iter(mm.readline, b""))
+            finally:
+                mm.seek(pos)
         except Exception as e:
             logging.error(f"Error: {e}")
             return False
@@ -189,6 +492,10 @@ class FileLookup:
         The query string is passed safely into an ``awk`` expression that
         checks if the entire line equals the query.
 
+        Files smaller than ``shell_threshold`` bytes are searched in-process
+        with `mmap_search` instead, since spawning ``awk`` costs far more
+        than the scan. ``awk`` runs with ``LC_ALL=C`` to compare raw bytes.
+
         Args:
             self (FileLookup): The lookup object holding the file path.
             query (bytes): The raw query string as bytes.
@@ -199,6 +506,8 @@ class FileLookup:
                 - ``False`` if not found, or if an error occurred \
                     (e.g., awk execution failure).
         """
+        if not self._use_shell:
+            return self.mmap_search(query)
         query_str = sanitize_payload(query, strip_ctrl=True)
         try:
             result = subprocess.run(
@@ -206,6 +515,7 @@ class FileLookup:
                 capture_output=True,
                 text=True,
                 check=False,
+                env=_shell_env(),
             )
             return bool(result.stdout.strip())
         except Exception as e:
@@ -216,10 +526,10 @@ class FileLookup:
         """
         Perform a full-line search by reading the file into memory at once.
 
-        This approach loads all lines into a list and \
-            checks whether the query string
-        plus a newline character exists in the list.\
-            Suitable only for smaller files.
+        This approach loads all lines into a frozenset at once and checks
+        whether the query string is one of them. The set is cached per file
+        path and modification time, so the file is only read again when it
+        changes. Suitable only for smaller files.
 
         Args:
             self (FileLookup): The lookup object holding the file path.
@@ -231,11 +541,10 @@ class FileLookup:
                 - ``False`` if not found, or if an error occurred \
                     (e.g., file I/O error).
         """
-        query_str = sanitize_payload(query, strip_ctrl=True)
         try:
-            with open(self.filepath, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                return f"{query_str}\n" in lines
+            mtime_ns = os.stat(self.filepath).st_mtime_ns
+            lines = _load_lineset(str(self.filepath), mtime_ns)
+            return _sanitize_bytes(query) in lines
         except Exception as e:
             logging.error(f"Error: {e}")
             return False
@@ -245,9 +554,12 @@ class FileLookup:
         Perform a direct lookup of the query string \
             using memory-mapped file access.
         The query is sanitized with `sanitize_payload`, encoded, and checked
-        against the contents of the lookup file using a memory map.
+        against the contents of the lookup file using a memory map that is
+        created on the first query and reused afterwards (see `_get_mmap`).
         This allows efficient searching without fully \
-                loading the file into memory.
+                loading the file into memory: the mapping is scanned in
+        place with ``find`` and never copied into a bytes object. The needles
+        for each query are built once and reused (see `_matcher_for`).
 
         Args:
             query (bytes): The raw query string to search for in the file.
@@ -258,14 +570,9 @@ class FileLookup:
                 - False otherwise.
         """
         # Sanitize the query byte string
-        sanitized_query = sanitize_payload(query, strip_ctrl=True)
-        query = f"{sanitized_query}\n".encode()
-        # Prepare a string to check the last line without next line
-        last_query = sanitized_query.encode()
+        line = _sanitize_bytes(query)
         try:
-            with open(self.filepath, "rb") as f:
-                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
-                    return query in mm[:] or last_query in mm[:]
+            return self._matcher_for(line)(self._get_mmap())
         except Exception as e:
             logging.error(f"Error: {e}")
             return False
@@ -275,8 +582,8 @@ class FileLookup:
         Look up the given query in the in-memory cache.
 
         The query is first sanitized using `sanitize_payload` with control
-        characters stripped, then checked against the cached lookup table
-        populated from the file at initialization.
+        characters stripped (memoized per raw query), then checked against
+        the cached lookup set populated from the file at initialization.
 
         Args:
             query (bytes): The raw query string to check.
@@ -286,9 +593,25 @@ class FileLookup:
                 - True if the sanitized query exists in the cache.
                 - False otherwise.
         """
+        return _sanitize_bytes(query) in self._cache
 
-        query_str = sanitize_payload(query, strip_ctrl=True)
-        return self._cache.get(query_str, False)
+    def cache_lookup_many(self, queries: Iterable[bytes]) -> list[bool]:
+        """
+        Look up a batch of queries in the in-memory cache.
+
+        Equivalent to calling `cache_lookup` on each query, but the method
+        and attribute lookups happen once for the whole batch and the loop
+        runs as a single list comprehension.
+
+        Args:
+            queries (Iterable[bytes]): The raw query strings to check.
+
+        Returns:
+            list[bool]: One result per query, in the same order.
+        """
+        cache = self._cache
+        sanitize = _sanitize_bytes
+        return [sanitize(query) in cache for query in queries]
 
     def find_match(self, query: bytes) -> bool:
         """
@@ -2,6 +2,7 @@ import pytest
 from .tree_search import TreeSearch
 import sys
 from collections import deque
+import numpy as np
 
 
 class Node:
@@ -20,6 +21,11 @@ class Node:
         """Stores a *copy* of the new list."""
         self._children = list(new_children)
 
+    @property
+    def children_view(self):
+        """Returns the underlying children list itself (do not mutate)."""
+        return self._children
+
     def add_child(self, node):
         """Helper method to build the tree."""
         self._children.append(node)
@@ -28,6 +34,30 @@ class Node:
     def __repr__(self):
         return f"<Node: {self.val}>"
 
+def build_csr(root):
+    """
+    Flattens a Node tree into CSR arrays (row_ptr, col_idx, vals).
+
+    Nodes are numbered in BFS order with the root at index 0; the children
+    of node i are col_idx[row_ptr[i]:row_ptr[i + 1]].
+    """
+    nodes = [root]
+    index = {id(root): 0}
+    row_ptr = [0]
+    col_idx = []
+
+    for node in nodes:  # `nodes` grows while we walk it, giving BFS order
+        for child in node.children_view:
+            index[id(child)] = len(nodes)
+            nodes.append(child)
+            col_idx.append(index[id(child)])
+        row_ptr.append(len(col_idx))
+
+    vals = np.array([node.val for node in nodes], dtype=object)
+    return (np.array(row_ptr, dtype=np.int32),
+            np.array(col_idx, dtype=np.int32),
+            vals)
+
 # --- Test Suite Setup ---
 
 @pytest.fixture(scope="session")
@@ -77,8 +107,12 @@ def sophisticated_tree():
 
     print(f"\n--- Built tree with {counter} nodes (Depth={MAX_DEPTH}, Width={WIDTH}) ---")
 
+    csr = build_csr(root)  # Same tree as flat (row_ptr, col_idx, vals)
+
     return {
         "root_node": root,
+        "csr": csr,
+        "csr_vals_hash": np.array([hash(v) for v in csr[2]], dtype=np.int64),
         "target_root": 'root_0',
         "target_middle": target_middle_val, # A node BFS will find faster
         "target_leaf": target_leaf_val,   # A node DFS *might* find faster (but here, it's the "worst case" for DFS)
@@ -137,4 +171,44 @@ def test_bfs_benchmark(benchmark, search_params):
         assert result is None, f"BFS found '{target}' when it shouldn't have."
     else:
         assert result is not None, f"BFS failed to find '{target}'."
-        assert result.val == target, f"BFS found wrong node. Expected '{target}', got '{result.val}'."
\ No newline at end of file
+        assert result.val == target, f"BFS found wrong node. Expected '{target}', got '{result.val}'."
+
+def test_bfs_csr_benchmark(benchmark, search_params, sophisticated_tree):
+    """
+    Benchmarks BFS over the CSR (flat array) form of the same tree.
+    Also validates the search result is correct.
+    """
+    _, target, expected_is_none = search_params
+    row_ptr, col_idx, vals = sophisticated_tree["csr"]
+
+    result = benchmark(TreeSearch.bfs_csr, row_ptr, col_idx, vals, target)
+
+    # --- Correctness Assertion ---
+    if expected_is_none:
+        assert result is None, f"BFS (CSR) found '{target}' when it shouldn't have."
+    else:
+        assert result is not None, f"BFS (CSR) failed to find '{target}'."
+        assert vals[result] == target, f"BFS (CSR) found wrong node. Expected '{target}', got '{vals[result]}'."
+
+
+def test_bfs_numba_benchmark(benchmark, search_params, sophisticated_tree):
+    """
+    Benchmarks the Numba-compiled BFS over the CSR form of the tree.
+    Also validates the search result is correct.
+    """
+    # Without numba the kernel runs interpreted; don't report that as Numba
+    pytest.importorskip("numba")
+    _, target, expected_is_none = search_params
+    row_ptr, col_idx, vals = sophisticated_tree["csr"]
+    vals_hash = sophisticated_tree["csr_vals_hash"]
+
+    # Warm up so JIT compilation is not part of the measurement
+    TreeSearch.bfs_numba(row_ptr, col_idx, vals, vals_hash, target)
+    result = benchmark(TreeSearch.bfs_numba, row_ptr, col_idx, vals, vals_hash, target)
+
+    # --- Correctness Assertion ---
+    if expected_is_none:
+        assert result is None, f"BFS (Numba) found '{target}' when it shouldn't have."
+    else:
+        assert result is not None, f"BFS (Numba) failed to find '{target}'."
+        assert vals[result] == target, f"BFS (Numba) found wrong node. Expected '{target}', got '{vals[result]}'."
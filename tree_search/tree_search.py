@@ -1,29 +1,112 @@
 from collections import deque
 
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the kernels then run as plain Python
+    def njit(**kwargs):
+        return lambda func: func
+
+
+@njit(cache=True)
+def _bfs_hash(row_ptr, col_idx, vals_hash, target_hash):
+    """BFS over CSR arrays comparing value hashes; returns an index or -1."""
+    n = vals_hash.shape[0]
+    if n == 0:
+        return -1
+
+    # Every node of a tree is enqueued exactly once, so n slots suffice
+    queue = np.empty(n, dtype=np.int64)
+    queue[0] = 0
+    head, tail = 0, 1
+
+    while head < tail:
+        current = queue[head]
+        head += 1
+
+        if vals_hash[current] == target_hash:
+            return current
+
+        for j in range(row_ptr[current], row_ptr[current + 1]):
+            queue[tail] = col_idx[j]
+            tail += 1
+
+    return -1
+
+
 class TreeSearch:
     @staticmethod
     def dfs(node, target):
-        if node.val == target:
-            return node
+        stack = [node]
+
+        while stack:
+            current = stack.pop()
+
+            if current.val == target:
+                return current
 
-        for child in node.children:
-            result = TreeSearch.dfs(child, target)
-            if result:
-                return result
+            # `children` returns a copy on every access; `children_view`
+            # does not. Reversed so the first child is visited first.
+            stack.extend(reversed(current.children_view))
 
-        return None 
+        return None
 
     @staticmethod
     def bfs(node, target):
-        queue = deque([node]) 
+        queue = deque((node,))
+        # Bind the deque methods once instead of looking them up per node
+        popleft = queue.popleft
+        extend = queue.extend
 
         while queue:
-            current = queue.popleft() 
+            current = popleft()
 
             if current.val == target:
                 return current
 
-            if hasattr(current, 'children') and current.children:
-                queue.extend(current.children)
-                
-        return None
\ No newline at end of file
+            # Extending with an empty list is cheap, so leaves need no guard
+            extend(current.children_view)
+
+        return None
+
+    @staticmethod
+    def bfs_csr(row_ptr, col_idx, vals, target):
+        """
+        BFS over a tree stored in CSR form; returns the node index or None.
+
+        The children of node ``i`` are ``col_idx[row_ptr[i]:row_ptr[i + 1]]``
+        and its value is ``vals[i]``; node 0 is the root.
+        """
+        if len(vals) == 0:
+            return None
+
+        queue = deque((0,))
+        popleft = queue.popleft
+        extend = queue.extend
+
+        while queue:
+            current = popleft()
+
+            if vals[current] == target:
+                return int(current)
+
+            extend(col_idx[row_ptr[current]:row_ptr[current + 1]])
+
+        return None
+
+    @staticmethod
+    def bfs_numba(row_ptr, col_idx, vals, vals_hash, target):
+        """
+        Numba-compiled BFS over a CSR tree; returns the node index or None.
+
+        ``vals_hash[i]`` must be ``hash(vals[i])``. The compiled loop only
+        compares hashes; a hash match is confirmed against ``vals`` and, on
+        the (unlikely) collision, the search is redone with `bfs_csr`.
+        """
+        found = _bfs_hash(row_ptr, col_idx, vals_hash, hash(target))
+        if found == -1:
+            return None
+        if vals[found] == target:
+            return int(found)
+        return TreeSearch.bfs_csr(row_ptr, col_idx, vals, target)